@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import numba
+import numpy
+
+
+@numba.njit(cache=True)
+def _count(mask: int) -> int:
+    """
+    Return the number of bits set in a candidate mask.
+    """
+
+    count = 0
+    while mask:
+        mask &= mask - 1
+        count += 1
+    return count
+
+
+@numba.njit(cache=True)
+def _value(bit: int) -> int:
+    """
+    Return the value represented by a candidate mask with a single bit set.
+    """
+
+    val = 1
+    while bit > 1:
+        bit >>= 1
+        val += 1
+    return val
+
+
+@numba.njit(cache=True)
+def solve(grid: numpy.ndarray) -> bool:
+    """
+    Fill in the empty cells of a classic Sudoku grid in place.
+
+    The grid is an array of 81 cells in row-major order, with 0 marking an empty cell.
+    This is the same search as 'Problem._solve_classic', compiled to native code: the
+    values used by each row, column and subgrid are tracked as 9-bit masks, and the search
+    branches on the empty cell with the fewest candidates. The recursion is replaced by an
+    explicit stack of the cells assigned so far and their untried candidates. Returns False
+    if the grid has no solution.
+    """
+
+    row_used = numpy.zeros(9, dtype=numpy.int32)
+    col_used = numpy.zeros(9, dtype=numpy.int32)
+    box_used = numpy.zeros(9, dtype=numpy.int32)
+
+    # Initialize from the preassigned cells.
+    for cell in range(81):
+        if grid[cell]:
+            row, col = cell // 9, cell % 9
+            box = 3 * (row // 3) + col // 3
+            bit = 1 << (grid[cell] - 1)
+            if (row_used[row] | col_used[col] | box_used[box]) & bit:
+                return False
+            row_used[row] |= bit
+            col_used[col] |= bit
+            box_used[box] |= bit
+
+    stack_cell = numpy.empty(81, dtype=numpy.int32)
+    stack_candidates = numpy.empty(81, dtype=numpy.int32)
+    depth = 0
+
+    while True:
+        # Find the empty cell with the fewest candidate values.
+        best, best_candidates, best_count = -1, 0, 10
+        for cell in range(81):
+            if grid[cell]:
+                continue
+            row, col = cell // 9, cell % 9
+            box = 3 * (row // 3) + col // 3
+            candidates = ~(row_used[row] | col_used[col] | box_used[box]) & 0x1FF
+            count = _count(candidates)
+            if count < best_count:
+                best, best_candidates, best_count = cell, candidates, count
+                if count <= 1:
+                    break
+
+        if best < 0:
+            return True
+        if best_count:
+            stack_cell[depth] = best
+            stack_candidates[depth] = best_candidates
+            depth += 1
+
+        # Assign the next untried candidate of the most recent cell on the stack, undoing
+        # its previous assignment and backtracking past cells with no candidates left.
+        while True:
+            if not depth:
+                return False
+            cell = stack_cell[depth - 1]
+            row, col = cell // 9, cell % 9
+            box = 3 * (row // 3) + col // 3
+            if grid[cell]:
+                bit = 1 << (grid[cell] - 1)
+                row_used[row] ^= bit
+                col_used[col] ^= bit
+                box_used[box] ^= bit
+                grid[cell] = 0
+            candidates = stack_candidates[depth - 1]
+            if candidates:
+                bit = candidates & -candidates
+                stack_candidates[depth - 1] = candidates ^ bit
+                grid[cell] = _value(bit)
+                row_used[row] |= bit
+                col_used[col] |= bit
+                box_used[box] |= bit
+                break
+            depth -= 1
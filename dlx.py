@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import typing
+
+
+class DancingLinks:
+    """
+    An exact cover problem, solved with Knuth's Algorithm X using dancing links.
+
+    The columns of the problem are numbered from 0. You add the candidate rows with
+    'add_row', optionally force rows into the cover with 'select', and find a set of
+    rows covering every column exactly once with 'search'.
+    """
+
+    def __init__(self, num_columns: int) -> None:
+        # The nodes of the toroidal linked list are stored in parallel lists. Node 0 is
+        # the root and nodes 1 through 'num_columns' are the column headers, which start
+        # out linked in a circle through the root.
+        n = num_columns + 1
+        self.left = [n - 1] + list(range(n - 1))
+        self.right = list(range(1, n)) + [0]
+        self.up = list(range(n))
+        self.down = list(range(n))
+        self.column = list(range(n))
+        self.row = [-1] * n
+        self.size = [0] * n
+
+        # The first node of each row, and the rows forced into the cover by 'select'.
+        self.first: list[int] = []
+        self.selected: list[int] = []
+
+    def add_row(self, columns: typing.Iterable[int]) -> int:
+        """
+        Add a row with a 1 in each of the given columns, and return its index.
+        """
+
+        row = len(self.first)
+        first = -1
+        for col in columns:
+            header = col + 1
+            node = len(self.column)
+            self.column.append(header)
+            self.row.append(row)
+
+            # Link the node in at the bottom of its column.
+            self.up.append(self.up[header])
+            self.down.append(header)
+            self.down[self.up[header]] = node
+            self.up[header] = node
+            self.size[header] += 1
+
+            # Link the node in at the end of its row.
+            if first < 0:
+                first = node
+                self.left.append(node)
+                self.right.append(node)
+            else:
+                self.left.append(self.left[first])
+                self.right.append(first)
+                self.right[self.left[first]] = node
+                self.left[first] = node
+        self.first.append(first)
+        return row
+
+    def select(self, row: int) -> None:
+        """
+        Force the given row into the cover.
+
+        Raises a ValueError if the row shares a column with a previously selected row.
+        """
+
+        node = self.first[row]
+        nodes = [node]
+        node = self.right[node]
+        while node != nodes[0]:
+            nodes.append(node)
+            node = self.right[node]
+        if any(self.right[self.left[self.column[node]]] != self.column[node] for node in nodes):
+            raise ValueError(f"row {row} conflicts with a selected row")
+        for node in nodes:
+            self._cover(self.column[node])
+        self.selected.append(row)
+
+    def search(self) -> list[int] | None:
+        """
+        Return the rows of an exact cover, or None if there is no exact cover.
+
+        The returned rows include the rows forced into the cover by 'select'.
+        """
+
+        solution = list(self.selected)
+        return solution if self._search(solution) else None
+
+    def _search(self, solution: list[int]) -> bool:
+        """
+        Extend the partial cover in 'solution' to an exact cover, returning False if that
+        is impossible. The links are restored to their original state before returning.
+        """
+
+        right, left, down = self.right, self.left, self.down
+        if right[0] == 0:
+            return True
+
+        # Branch on the column with the fewest remaining rows.
+        header, best = 0, len(self.first) + 1
+        col = right[0]
+        while col:
+            if self.size[col] < best:
+                header, best = col, self.size[col]
+            col = right[col]
+        if not best:
+            return False
+
+        found = False
+        self._cover(header)
+        node = down[header]
+        while node != header:
+            solution.append(self.row[node])
+            other = right[node]
+            while other != node:
+                self._cover(self.column[other])
+                other = right[other]
+            found = self._search(solution)
+            other = left[node]
+            while other != node:
+                self._uncover(self.column[other])
+                other = left[other]
+            if found:
+                break
+            solution.pop()
+            node = down[node]
+        self._uncover(header)
+        return found
+
+    def _cover(self, header: int) -> None:
+        """
+        Remove a column, and every row with a 1 in that column, from the links.
+        """
+
+        left, right, up, down = self.left, self.right, self.up, self.down
+        right[left[header]] = right[header]
+        left[right[header]] = left[header]
+        node = down[header]
+        while node != header:
+            other = right[node]
+            while other != node:
+                down[up[other]] = down[other]
+                up[down[other]] = up[other]
+                self.size[self.column[other]] -= 1
+                other = right[other]
+            node = down[node]
+
+    def _uncover(self, header: int) -> None:
+        """
+        Undo a call to '_cover' for the given column.
+        """
+
+        left, right, up, down = self.left, self.right, self.up, self.down
+        node = up[header]
+        while node != header:
+            other = left[node]
+            while other != node:
+                self.size[self.column[other]] += 1
+                down[up[other]] = other
+                up[down[other]] = other
+                other = left[other]
+            node = up[node]
+        right[left[header]] = header
+        left[right[header]] = header
@@ -1,13 +1,156 @@
 from __future__ import annotations
 
+import array
 import dataclasses
+import functools
+import importlib
+import importlib.util
 import itertools
 import re
 import sys
 import typing
 
+import numpy
+import ortools.linear_solver.linear_solver_pb2
 import ortools.linear_solver.pywraplp
 
+import dlx
+
+# Regular expressions used to parse the input format.
+_CLEAN = re.compile(r"#.*|\s+")
+_CELL = re.compile(r"\(([1-9]),([1-9])\)")
+_LINE = re.compile(r"^([^:]+):(\d+)$")
+
+# The number of cells the pure Python classic search may try before handing the instance
+# over to the search compiled by numba, if it is installed. Importing numba and loading the
+# compiled code takes about as long as the pure Python search takes to try this many cells,
+# and far longer than it takes to solve a typical instance.
+_NUMBA_BUDGET = 80000
+
+# Index lists for the Sudoku grid, numbered from 0, precomputed once rather than rebuilt by
+# every loop over them. '_PAIRS' holds every pair of indices, such as the (row, column) of
+# each cell in row-major order, and '_BOX_OF' holds the subgrid of each cell.
+_PAIRS = [(i, j) for i in range(9) for j in range(9)]
+_BOX_OF = [3 * (row // 3) + col // 3 for row, col in _PAIRS]
+
+# The 27 "lines" in which every value must appear exactly once: the rows, the columns and
+# the non-overlapping 3x3 subgrids. '_LINE_CELLS' gives each line as the list of its nine
+# cells, and '_LINES' gives it as the arrays of the row indices and column indices of its
+# cells, ready to index an array of variables.
+_LINE_CELLS = list(itertools.chain(
+    ([(row, col) for col in range(9)] for row in range(9)),
+    ([(row, col) for row in range(9)] for col in range(9)),
+    ([cell for cell, box_of in zip(_PAIRS, _BOX_OF) if box_of == box] for box in range(9)),
+))
+_LINES = [tuple(numpy.array(cells).T) for cells in _LINE_CELLS]
+
+# The pretty representation of a solution, with a slot for the value of each cell in
+# row-major order.
+_GRID_TEMPLATE = "\n".join(
+    3 * (["+-------+-------+-------+"] + 3 * ["| {} {} {} | {} {} {} | {} {} {} |"])
+    + ["+-------+-------+-------+"],
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _classic_model() -> tuple[ortools.linear_solver.linear_solver_pb2.MPModelProto, numpy.ndarray]:
+    """
+    Build the part of the integer program that is the same for every Sudoku instance.
+
+    Rather than creating variables and constraints one coefficient at a time through the
+    solver wrapper, the model is described as a protocol buffer that is installed into the
+    solver with a single call. The model is returned together with the array of indices of
+    its decision variables. It is built once and must not be modified; copy it before
+    adding the constraints of a problem instance.
+    """
+
+    model = ortools.linear_solver.linear_solver_pb2.MPModelProto()
+
+    # For every combination of cell and value, create a binary decision variable
+    # that determines if the value belongs at that cell in the solution. We store
+    # the indices of these variables in a 3-dimensional array indexed by the rows,
+    # columns, and values.
+    #
+    # The value assigned to a cell is the value-weighted sum of its decision
+    # variables, so no separate variables are needed to hold the solution.
+    #
+    # There is no objective; any feasible assignment is a solution.
+    decision_vars = numpy.arange(729).reshape(9, 9, 9)
+    model.variable.extend(
+        ortools.linear_solver.linear_solver_pb2.MPVariableProto(
+            lower_bound=0,
+            upper_bound=1,
+            is_integer=True,
+            name=f"d{row + 1}{col + 1}{val + 1}",
+        )
+        for row, col in _PAIRS
+        for val in range(9)
+    )
+
+    # Every cell must take a value assignment in the solution.
+    #
+    # For each cell, the sum of the decision variables over values
+    # must be exactly equal to 1.
+    for row, col in _PAIRS:
+        _add_constraint(model, 1, decision_vars[row, col, :])
+
+    # Every value appears exactly once on each row, on each column, and in each of the
+    # non-overlapping 3x3 subgrids in the solution.
+    #
+    # For each of these lines and each value, the sum of the decision variables
+    # over the cells of the line must be exactly equal to 1.
+    for rows, cols in _LINES:
+        for var_index in decision_vars[rows, cols, :].T:
+            _add_constraint(model, 1, var_index)
+
+    return model, decision_vars
+
+
+def _add_constraint(
+    model: ortools.linear_solver.linear_solver_pb2.MPModelProto,
+    bound: int,
+    var_index: numpy.ndarray,
+    coefficient: numpy.ndarray | None = None,
+) -> None:
+    """
+    Add the constraint that the weighted sum of the given variables equals 'bound'.
+
+    The coefficients default to 1 for every variable.
+    """
+
+    constraint = model.constraint.add(lower_bound=bound, upper_bound=bound)
+    constraint.var_index.extend(var_index.ravel().tolist())
+    if coefficient is None:
+        constraint.coefficient.extend([1] * var_index.size)
+    else:
+        constraint.coefficient.extend(coefficient.ravel().tolist())
+
+
+@functools.lru_cache(maxsize=1)
+def _numba_installed() -> bool:
+    """
+    Return whether numba is installed, without importing it.
+    """
+
+    return importlib.util.find_spec("numba") is not None
+
+
+class _BudgetExceeded(Exception):
+    """
+    Raised when the pure Python classic search runs past '_NUMBA_BUDGET'.
+    """
+
+
+@functools.lru_cache(maxsize=128)
+def _solve_cached(problem: Problem, backend: str) -> Solution:
+    """
+    Solve a problem instance, remembering the solutions of recently solved instances.
+
+    An instance with no solution raises a ValueError, which is not cached.
+    """
+
+    return problem._solve(backend)
+
 
 @dataclasses.dataclass
 class Problem:
@@ -31,30 +174,24 @@ class Problem:
         by a comma, just like a tuple in python.
         """
 
-        return Problem({
-            cells: int(right_side)
-            # read the lines
-            for line in input.readlines()
-            # strip out comments
-            for line in [re.sub(r"#.*$", "", line)]
-            # strip out whitespace
-            for line in [re.sub(r"\s*", "", line)]
+        problem = {}
+        for line in input:
+            # strip out comments and whitespace
+            line = _CLEAN.sub("", line)
             # filter out empty lines
-            if line
+            if not line:
+                continue
             # split the line on the colon; the left side is a comma-separated
             # list of cells and the right side is their sum
-            for left_side, right_side in [re.split(r":", line)]
-            for cells in [
-                frozenset(
-                    # parse the list of cells into tuples
-                    tuple(map(int, map(match.group, range(1, 3))))
-                    for match in map(
-                        re.compile(r"\(([1-9]),([1-9])\)").match,
-                        re.findall(r"(\([1-9],[1-9]\)),?", left_side),
-                    )
-                )
-            ]
-        })
+            match = _LINE.match(line)
+            if not match:
+                raise ValueError(f"malformed line: {line!r}")
+            # parse the list of cells into tuples
+            cells = frozenset((int(row), int(col)) for row, col in _CELL.findall(match[1]))
+            if not cells:
+                raise ValueError(f"malformed line: {line!r}")
+            problem[cells] = int(match[2])
+        return Problem(problem)
 
     def __str__(self) -> str:
         """
@@ -75,7 +212,14 @@ class Problem:
 
         print(self, file=out)
 
-    def solve(self, backend: str = "SCIP") -> Solution:
+    def __hash__(self) -> int:
+        """
+        Return a hash of the groups and sums of the problem instance.
+        """
+
+        return hash(frozenset(self.problem.items()))
+
+    def solve(self, backend: str = "CP_SAT") -> Solution:
         """
         Solve a Sudoku instance.
 
@@ -83,106 +227,383 @@ class Problem:
         either an integer from 1 though 9 inclusive (if the cell has a preassigned value in
         the problem) or None (if the cell should be solved for in the solution). The return
         value is a 9-element list of 9-element lists of integers that fully solve the Sudoku.
+
+        Classic instances, where every group is a single preassigned cell, are solved
+        directly by '_solve_classic', or as an exact cover problem by '_solve_dlx' if the
+        backend is "DLX". Instances with killer-style group sums are solved with the CP-SAT
+        constraint solver by default (or if the backend is "SAT"), or with any other backend
+        supported by the ortools linear solver wrapper, such as "SCIP".
+
+        Solutions are cached, so solving an identical instance again with the same backend
+        returns the earlier solution without doing any work.
         """
 
-        # Create "sets" representing the rows, columns and values for the Sudoku problem.
-        rows, columns, values = 3 * [range(1, 10)]
+        # Cache a copy of the instance, so that modifying this one later does not affect
+        # the cache.
+        return _solve_cached(Problem(dict(self.problem)), backend)
 
-        # Instantiate the solver. By default, it uses the SCIP backend. https://www.scipopt.org/
-        solver = ortools.linear_solver.pywraplp.Solver.CreateSolver(backend)
+    def _solve(self, backend: str) -> Solution:
+        """
+        Solve a Sudoku instance with the given backend, bypassing the cache.
+        """
+
+        if frozenset() in self.problem:
+            raise ValueError("every group in the problem instance must contain a cell")
+        if all(len(group) == 1 for group in self.problem):
+            if backend == "DLX":
+                return self._solve_dlx()
+            return self._solve_classic()
+        if backend == "DLX":
+            raise ValueError("the DLX backend only solves classic Sudoku instances")
+        # The ortools linear solver wrapper also accepts "SAT" as a name for CP-SAT, but it
+        # would hand CP-SAT the exactly-one rules as generic linear constraints.
+        if backend in ["CP_SAT", "SAT"]:
+            return self._solve_cp_sat()
+        return self._solve_integer_program(backend)
+
+    def _solve_cp_sat(self) -> Solution:
+        """
+        Solve a Sudoku instance with the CP-SAT constraint solver.
+
+        Each of the cell, row, column and subgrid rules is a native exactly-one constraint
+        over boolean decision variables, which CP-SAT propagates directly instead of
+        treating it as a row of a linear program.
+        """
+
+        # CP-SAT is imported here rather than at the top of the module, since importing it
+        # is slow and classic instances never need it.
+        import ortools.sat.python.cp_model
+
+        model = ortools.sat.python.cp_model.CpModel()
 
-        # For every combination of cell and value, create a binary decision variable
+        # For every combination of cell and value, create a boolean decision variable
         # that determines if the value belongs at that cell in the solution. We store
-        # these variables in a 3-dimensional array indexed by the rows, columns, and values.
-        decision_vars = {
-            row: {
-                col: {val: solver.IntVar(0, 1, f"d{row}{col}{val}") for val in values}
-                for col in columns
-            }
-            for row in rows
-        }
-
-        # For every cell, create an integer variable taking values over the range [1, 9]
-        # that will hold the value assignment for that cell. We store these variables in
-        # a 2-dimensional array indexed by the rows and columns.
-        solution_vars = {
-            row: {col: solver.IntVar(1, 9, f"s{row}{col}") for col in columns}
-            for row in rows
-        }
-
-        # The objective is to minimize the sum of the solution variables.
-        objective = solver.Objective()
-        objective.SetMinimization()
-        for row, col in itertools.product(rows, columns):
-            objective.SetCoefficient(solution_vars[row][col], 1)
+        # these variables in a 3-dimensional array indexed by the rows, columns, and
+        # values, numbered from 0.
+        decision_vars = numpy.empty((9, 9, 9), dtype=object)
+        for (row, col), val in itertools.product(_PAIRS, range(9)):
+            decision_vars[row, col, val] = model.NewBoolVar(f"d{row + 1}{col + 1}{val + 1}")
 
         # Initialize from the data in the problem instance.
         #
-        # For each set of cells in the problem instance, the sum of their
-        # solution variables must be equal to the sum in the problem instance.
+        # A single cell is preassigned its value by fixing its decision variables. For
+        # each other set of cells in the problem instance, the sum of the values assigned
+        # to the cells must be equal to the sum in the problem instance.
         for group, group_sum in self.problem.items():
-            constraint = solver.Constraint(group_sum, group_sum)
-            for row, col in group:
-                constraint.SetCoefficient(solution_vars[row][col], 1)
+            if len(group) == 1:
+                (row, col), = group
+                model.AddBoolAnd([
+                    var if val + 1 == group_sum else var.Not()
+                    for val, var in enumerate(decision_vars[row - 1, col - 1, :])
+                ])
+                continue
+            cells = [(row - 1, col - 1, val) for row, col in group for val in range(9)]
+            model.Add(
+                ortools.sat.python.cp_model.LinearExpr.WeightedSum(
+                    [decision_vars[cell] for cell in cells],
+                    [val + 1 for _, _, val in cells],
+                ) == group_sum,
+            )
+
+        # Rule out the values that propagation has already eliminated.
+        candidates = self._propagate()
+        model.AddBoolAnd([
+            decision_vars[row, col, val].Not()
+            for (row, col), cell_candidates in candidates.items()
+            for val in range(9)
+            if val + 1 not in cell_candidates
+        ])
+
+        # Every cell takes exactly one value, and every value appears exactly once on each
+        # row, on each column, and in each of the non-overlapping 3x3 subgrids.
+        for row, col in _PAIRS:
+            model.AddExactlyOne(decision_vars[row, col, :].tolist())
+        for rows, cols in _LINES:
+            for line_vars in decision_vars[rows, cols, :].T:
+                model.AddExactlyOne(line_vars.tolist())
 
-        # Every cell must take a value assignment in the solution.
-        #
-        # For each cell, the sum of the decision variables over values
-        # must be exactly equal to 1.
-        for row, col in itertools.product(rows, columns):
-            constraint = solver.Constraint(1, 1)
-            for val in values:
-                constraint.SetCoefficient(decision_vars[row][col][val], 1)
-
-        # Every value appears exactly once on each row in the solution.
-        #
-        # For each row and value, the sum of the decision variables over
-        # columns must be exactly equal to 1.
-        for row, val in itertools.product(rows, values):
-            constraint = solver.Constraint(1, 1)
-            for col in columns:
-                constraint.SetCoefficient(decision_vars[row][col][val], 1)
-
-        # Every value appears exactly once on each column in the solution.
-        #
-        # For each column and value, the sum of the decision variables
-        # over rows must be exactly equal to 1.
-        for col, val in itertools.product(columns, values):
-            constraint = solver.Constraint(1, 1)
-            for row in rows:
-                constraint.SetCoefficient(decision_vars[row][col][val], 1)
+        # Solve the instance.
+        solver = ortools.sat.python.cp_model.CpSolver()
+        status = solver.Solve(model)
+        if status not in [
+            ortools.sat.python.cp_model.OPTIMAL,
+            ortools.sat.python.cp_model.FEASIBLE,
+        ]:
+            raise ValueError("the problem instance has no solution")
+
+        # Extract and return the solution.
+        return Solution(bytes(
+            sum(val + 1 for val in range(9) if solver.BooleanValue(decision_vars[row, col, val]))
+            for row, col in _PAIRS
+        ))
 
+    def _solve_integer_program(self, backend: str) -> Solution:
+        """
+        Solve a Sudoku instance as an integer program with the given ortools backend.
+        """
 
-        # Every value appears exactly once in each of the non-overlapping 3x3 subgrids.
+        # Start from a copy of the constraints shared by every Sudoku instance.
+        classic_model, decision_vars = _classic_model()
+        model = ortools.linear_solver.linear_solver_pb2.MPModelProto()
+        model.CopyFrom(classic_model)
+
+        # Initialize from the data in the problem instance.
         #
-        # For each subgrid and value, the sum of the decision variables
-        # over the subgrid must be exactly equal to 1.
-        for i, j, val in itertools.product(range(3), range(3), values):
-            constraint = solver.Constraint(1, 1)
-            for row, col in itertools.product(*map(lambda x: range(3 * x + 1, 3 * x + 4), (i, j))):
-                constraint.SetCoefficient(decision_vars[row][col][val], 1)
-
-        # Connect the decision variables to the solution variables.
+        # A single cell is preassigned its value by fixing the bounds of its decision
+        # variables, so presolve eliminates them immediately.
+        groups = []
+        for group, group_sum in self.problem.items():
+            if len(group) > 1:
+                groups.append((group, group_sum))
+                continue
+            (row, col), = group
+            for val, index in enumerate(decision_vars[row - 1, col - 1, :]):
+                variable = model.variable[index]
+                variable.lower_bound = variable.upper_bound = int(val + 1 == group_sum)
+
+        # Rule out the values that propagation has already eliminated by fixing their
+        # decision variables to 0. If propagation leaves a cell without candidates, or
+        # eliminates the value of a preassigned cell, the instance has no solution.
+        for (row, col), cell_candidates in self._propagate().items():
+            if not cell_candidates:
+                raise ValueError("the problem instance has no solution")
+            for val, index in enumerate(decision_vars[row, col, :]):
+                if val + 1 not in cell_candidates:
+                    variable = model.variable[index]
+                    if variable.lower_bound:
+                        raise ValueError("the problem instance has no solution")
+                    variable.upper_bound = 0
+
+        # For each other set of cells in the problem instance, the sum of the values
+        # assigned to the cells must be equal to the sum in the problem instance.
         #
-        # For every (row, column), the value-weighted sum of the decision
-        # variables is equal to the solution variable.
-        for row, col in itertools.product(rows, columns):
-            constraint = solver.Constraint(0, 0)
-            constraint.SetCoefficient(solution_vars[row][col], -1)
-            for val in values:
-                constraint.SetCoefficient(decision_vars[row][col][val], val)
-
-        # Solve the instance.
-        solver.Solve()
+        # The decision variable indices of every group are looked up in a single pass
+        # over the cells of all the groups, then split back into one array per group.
+        cells = numpy.array(
+            [cell for group, _ in groups for cell in group], dtype=numpy.int32,
+        ).reshape(-1, 2) - 1
+        cage_indices = list(zip(
+            numpy.split(
+                decision_vars[cells[:, 0], cells[:, 1], :].astype(numpy.int32),
+                numpy.cumsum([len(group) for group, _ in groups])[:-1],
+            ),
+            (group_sum for _, group_sum in groups),
+        ))
+        for indices, group_sum in cage_indices:
+            _add_constraint(
+                model,
+                group_sum,
+                indices,
+                numpy.broadcast_to(numpy.arange(1, 10), indices.shape),
+            )
+
+        # Instantiate the solver, load the model and solve the instance.
+        solver = ortools.linear_solver.pywraplp.Solver.CreateSolver(backend)
+        error = solver.LoadModelFromProto(model)
+        if error:
+            raise ValueError(f"the integer program could not be loaded: {error}")
+        status = solver.Solve()
+        if status not in [
+            ortools.linear_solver.pywraplp.Solver.OPTIMAL,
+            ortools.linear_solver.pywraplp.Solver.FEASIBLE,
+        ]:
+            raise ValueError("the problem instance has no solution")
 
         # Extract and return the solution.
-        return Solution({
-            (row, col): int(solution_vars[row][col].solution_value())
-            for row, col in itertools.product(rows, columns)
-        })
+        variables = solver.variables()
+        return Solution(bytes(
+            sum(
+                val + 1
+                for val in range(9)
+                if variables[decision_vars[row, col, val]].solution_value() > 0.5
+            )
+            for row, col in _PAIRS
+        ))
+
+    def _propagate(self) -> dict[tuple[int, int], set[int]]:
+        """
+        Narrow down the candidate values of each cell, with rows and columns numbered from 0.
 
+        Starting from every value for every cell, this repeatedly removes the values that
+        would put a group's sum out of reach of the smallest and largest candidates of the
+        group's other cells, and removes the value of each cell with a single candidate from
+        the other cells on its row, column and subgrid, until nothing changes. A cell with
+        no candidates left means the instance has no solution.
+        """
 
-@dataclasses.dataclass
+        candidates = {cell: set(range(1, 10)) for cell in _PAIRS}
+        groups = [
+            ([(row - 1, col - 1) for row, col in group], group_sum)
+            for group, group_sum in self.problem.items()
+        ]
+
+        changed = True
+        while changed:
+            changed = False
+
+            # Remove the values that make a group's sum unreachable.
+            for cells, group_sum in groups:
+                if not all(candidates[cell] for cell in cells):
+                    return candidates
+                low = sum(min(candidates[cell]) for cell in cells)
+                high = sum(max(candidates[cell]) for cell in cells)
+                for cell in cells:
+                    cell_candidates = candidates[cell]
+                    smallest = group_sum - (high - max(cell_candidates))
+                    largest = group_sum - (low - min(cell_candidates))
+                    reachable = {val for val in cell_candidates if smallest <= val <= largest}
+                    if reachable != cell_candidates:
+                        candidates[cell] = reachable
+                        changed = True
+                        if not reachable:
+                            return candidates
+
+            # Remove the value of each cell with a single candidate from the rest of its lines.
+            for cells in _LINE_CELLS:
+                for cell in cells:
+                    if len(candidates[cell]) != 1:
+                        continue
+                    val, = candidates[cell]
+                    for other in cells:
+                        if other != cell and val in candidates[other]:
+                            candidates[other] = candidates[other] - {val}
+                            changed = True
+
+        return candidates
+
+    def _solve_classic(self) -> Solution:
+        """
+        Solve a classic Sudoku instance by constraint propagation and backtracking.
+
+        The values used by each row, column and subgrid are tracked as 9-bit masks, where
+        bit 'v - 1' is set once the value 'v' is placed. The search always branches on the
+        empty cell with the fewest remaining candidates, so forced cells are filled in
+        without any guessing. If numba is installed and the search takes more than
+        '_NUMBA_BUDGET' tries, it starts over as native code in '_solver_numba.solve'.
+        """
+
+        # The grid holds the value assignment of each cell in row-major order, with 0
+        # marking a cell that has not been assigned yet, in a single byte buffer.
+        grid = array.array("B", bytes(81))
+        row_used, col_used, box_used = [0] * 9, [0] * 9, [0] * 9
+
+        # Initialize from the preassigned cells in the problem instance.
+        for group, val in self.problem.items():
+            (row, col), = group
+            row, col = row - 1, col - 1
+            box = _BOX_OF[9 * row + col]
+            bit = 1 << (val - 1) if 1 <= val <= 9 else 0
+            if not bit or (row_used[row] | col_used[col] | box_used[box]) & bit:
+                raise ValueError("the problem instance has no solution")
+            grid[9 * row + col] = val
+            row_used[row] |= bit
+            col_used[col] |= bit
+            box_used[box] |= bit
+
+        givens = grid.tobytes()
+        empty = [cell for cell in range(81) if not grid[cell]]
+        budget = _NUMBA_BUDGET if _numba_installed() else -1
+
+        def search() -> bool:
+            """
+            Fill in the remaining empty cells, returning False if that is impossible.
+            """
+
+            nonlocal budget
+            if not budget:
+                raise _BudgetExceeded()
+            budget -= 1
+
+            # Find the empty cell with the fewest candidate values.
+            best, best_candidates, best_count = -1, 0, 10
+            for cell in empty:
+                if grid[cell]:
+                    continue
+                row, col = _PAIRS[cell]
+                box = _BOX_OF[cell]
+                candidates = ~(row_used[row] | col_used[col] | box_used[box]) & 0x1FF
+                count = bin(candidates).count("1")
+                if count < best_count:
+                    if not count:
+                        return False
+                    best, best_candidates, best_count = cell, candidates, count
+                    if count == 1:
+                        break
+
+            if best < 0:
+                return True
+
+            # Try each candidate value in turn, undoing the assignment on failure.
+            row, col = _PAIRS[best]
+            box = _BOX_OF[best]
+            while best_candidates:
+                bit = best_candidates & -best_candidates
+                best_candidates ^= bit
+                grid[best] = bit.bit_length()
+                row_used[row] |= bit
+                col_used[col] |= bit
+                box_used[box] |= bit
+                if search():
+                    return True
+                row_used[row] ^= bit
+                col_used[col] ^= bit
+                box_used[box] ^= bit
+            grid[best] = 0
+            return False
+
+        try:
+            solved = search()
+        except _BudgetExceeded:
+            # Start over from the preassigned cells with the compiled search, which fills in
+            # the grid through a view of the same buffer.
+            grid = array.array("B", givens)
+            solver_numba = importlib.import_module("_solver_numba")
+            solved = solver_numba.solve(numpy.frombuffer(grid, dtype=numpy.uint8))
+        if not solved:
+            raise ValueError("the problem instance has no solution")
+
+        return Solution(grid.tobytes())
+
+    def _solve_dlx(self) -> Solution:
+        """
+        Solve a classic Sudoku instance as an exact cover problem.
+
+        Each combination of cell and value is a row covering four of the 324 columns: one
+        for the cell, and one each for the value in its row, column and subgrid. The
+        preassigned cells are forced into the cover before searching for the rest.
+        """
+
+        links = dlx.DancingLinks(324)
+        for (cell, (row, col)), val in itertools.product(enumerate(_PAIRS), range(9)):
+            box = _BOX_OF[cell]
+            links.add_row([
+                9 * row + col,
+                81 + 9 * row + val,
+                162 + 9 * col + val,
+                243 + 9 * box + val,
+            ])
+
+        # Initialize from the preassigned cells in the problem instance.
+        for group, val in self.problem.items():
+            (row, col), = group
+            if not 1 <= val <= 9:
+                raise ValueError("the problem instance has no solution")
+            links.select(81 * (row - 1) + 9 * (col - 1) + val - 1)
+
+        selected = links.search()
+        if selected is None:
+            raise ValueError("the problem instance has no solution")
+
+        # Each row of the cover assigns a value to a cell.
+        grid = [0] * 81
+        for selected_row in selected:
+            cell, val = divmod(selected_row, 9)
+            grid[cell] = val + 1
+
+        return Solution(bytes(grid))
+
+
+@dataclasses.dataclass(frozen=True)
 class Solution:
     """
     A wrapper for a solution to a problem.
@@ -192,45 +613,25 @@ class Solution:
     the solution to be pretty-printed to a stream if you like.
     """
 
-    solution: dict[(int, int), int]
+    # The value of each cell in row-major order.
+    solution: bytes
 
     def __getitem__(self, cell: tuple[int, int]) -> int:
         """
         Return the solution value for the given cell.
         """
 
-        return self.solution[cell]
+        row, col = cell
+        if not (1 <= row <= 9 and 1 <= col <= 9):
+            raise KeyError(cell)
+        return self.solution[9 * (row - 1) + col - 1]
 
     def __str__(self) -> str:
         """
         Return a pretty represention of the solution suitable for output to a terminal.
         """
 
-        def row(i: int) -> str:
-            """
-            Return the string representation of a given row in the solution.
-            """
-
-            return " ".join([
-                "|",
-                " | ".join(
-                    " ".join(str(self[(i, 3 * k + j - 3)]) for j in range(1, 4))
-                    for k in range(1, 4)
-                ),
-                "|",
-            ])
-
-        return "\n".join(
-            itertools.chain(
-                ["+-------+-------+-------+"],
-                map(row, range(1, 4)),
-                ["+-------+-------+-------+"],
-                map(row, range(4, 7)),
-                ["+-------+-------+-------+"],
-                map(row, range(7, 10)),
-                ["+-------+-------+-------+"],
-            ),
-        )
+        return _GRID_TEMPLATE.format(*self.solution)
 
     def print(self, out: typing.TextIO) -> None:
         """
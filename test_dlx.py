@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import unittest
+
+import dlx
+
+
+class TestDancingLinks(unittest.TestCase):
+
+    def test_search(self) -> None:
+        # The example exact cover problem from Knuth's "Dancing Links" paper.
+        links = dlx.DancingLinks(7)
+        for columns in [[2, 4, 5], [0, 3, 6], [1, 2, 5], [0, 3], [1, 6], [3, 4, 6]]:
+            links.add_row(columns)
+        self.assertEqual(sorted(links.search()), [0, 3, 4])
+
+    def test_search_selected(self) -> None:
+        links = dlx.DancingLinks(3)
+        for columns in [[0, 1, 2], [0], [1], [2]]:
+            links.add_row(columns)
+        links.select(1)
+        self.assertEqual(sorted(links.search()), [1, 2, 3])
+
+    def test_select_conflict(self) -> None:
+        links = dlx.DancingLinks(2)
+        for columns in [[0, 1], [0]]:
+            links.add_row(columns)
+        links.select(0)
+        with self.assertRaises(ValueError):
+            links.select(1)
+
+    def test_search_no_cover(self) -> None:
+        links = dlx.DancingLinks(3)
+        for columns in [[0, 1], [1, 2]]:
+            links.add_row(columns)
+        self.assertIsNone(links.search())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import unittest
+
+import numpy
+
+try:
+    import _solver_numba
+except ImportError:
+    _solver_numba = None
+
+
+@unittest.skipIf(_solver_numba is None, "numba is not installed")
+class TestSolverNumba(unittest.TestCase):
+
+    def test_solve(self) -> None:
+        grid = numpy.zeros(81, dtype=numpy.uint8)
+        givens = {1: 4, 2: 2, 7: 8, 15: 6, 17: 9, 20: 5, 24: 1, 31: 7, 34: 3, 36: 3, 39: 2}
+        for cell, val in givens.items():
+            grid[cell] = val
+        self.assertTrue(_solver_numba.solve(grid))
+
+        # The givens are kept, and every row, column and subgrid holds each value once.
+        for cell, val in givens.items():
+            self.assertEqual(grid[cell], val)
+        solution = grid.reshape(9, 9)
+        for i in range(9):
+            box = solution[3 * (i // 3):3 * (i // 3) + 3, 3 * (i % 3):3 * (i % 3) + 3]
+            for line in [solution[i, :], solution[:, i], box.ravel()]:
+                self.assertEqual(sorted(line.tolist()), list(range(1, 10)))
+
+    def test_solve_conflicting_givens(self) -> None:
+        grid = numpy.zeros(81, dtype=numpy.uint8)
+        grid[0] = grid[8] = 5
+        self.assertFalse(_solver_numba.solve(grid))
+
+
+if __name__ == '__main__':
+    unittest.main()
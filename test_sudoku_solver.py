@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import io
 import itertools
+import typing
 import unittest
+import unittest.mock
 
 from rules_python.python.runfiles import runfiles
 
@@ -11,41 +14,177 @@ import sudoku_solver
 class TestSudokuSolver(unittest.TestCase):
 
     def test_solve_sudoku(self) -> None:
-        self._assert_solved_instance(
-            "example_sudoku.txt",
-            [
-                [ 6, 4, 2, 7, 9, 1, 3, 8, 5 ],
-                [ 1, 3, 7, 5, 8, 6, 2, 4, 9 ],
-                [ 8, 9, 5, 4, 3, 2, 1, 7, 6 ],
-                [ 4, 6, 1, 8, 7, 5, 9, 3, 2 ],
-                [ 3, 5, 8, 2, 6, 9, 4, 1, 7 ],
-                [ 7, 2, 9, 1, 4, 3, 6, 5, 8 ],
-                [ 9, 1, 3, 6, 5, 7, 8, 2, 4 ],
-                [ 5, 8, 6, 3, 2, 4, 7, 9, 1 ],
-                [ 2, 7, 4, 9, 1, 8, 5, 6, 3 ],
-            ],
-        )
+        for backend in ["CP_SAT", "DLX"]:
+            with self.subTest(backend=backend):
+                self._assert_solved_instance(
+                    "example_sudoku.txt",
+                    [
+                        [ 6, 4, 2, 7, 9, 1, 3, 8, 5 ],
+                        [ 1, 3, 7, 5, 8, 6, 2, 4, 9 ],
+                        [ 8, 9, 5, 4, 3, 2, 1, 7, 6 ],
+                        [ 4, 6, 1, 8, 7, 5, 9, 3, 2 ],
+                        [ 3, 5, 8, 2, 6, 9, 4, 1, 7 ],
+                        [ 7, 2, 9, 1, 4, 3, 6, 5, 8 ],
+                        [ 9, 1, 3, 6, 5, 7, 8, 2, 4 ],
+                        [ 5, 8, 6, 3, 2, 4, 7, 9, 1 ],
+                        [ 2, 7, 4, 9, 1, 8, 5, 6, 3 ],
+                    ],
+                    backend=backend,
+                )
+
+    def test_solve_sudoku_without_numba(self) -> None:
+        # Run only the pure Python search, bypassing any cached solutions.
+        with unittest.mock.patch.object(sudoku_solver, "_numba_installed", return_value=False):
+            sudoku_solver._solve_cached.cache_clear()
+            self.test_solve_sudoku()
+            self.test_solve_sudoku_conflicting_givens()
+        sudoku_solver._solve_cached.cache_clear()
+
+    def test_solve_sudoku_over_budget(self) -> None:
+        # Hand the instance over to the numba search straight away, if numba is installed.
+        with unittest.mock.patch.object(sudoku_solver, "_NUMBA_BUDGET", 0):
+            sudoku_solver._solve_cached.cache_clear()
+            self.test_solve_sudoku()
+            self.test_solve_sudoku_conflicting_givens()
+        sudoku_solver._solve_cached.cache_clear()
 
     def test_solve_killer_sudoku(self) -> None:
-        self._assert_solved_instance(
-            "example_killer_sudoku.txt",
-            [
-                [ 1, 6, 5, 8, 7, 2, 3, 9, 4, ],
-                [ 4, 7, 2, 5, 3, 9, 6, 1, 8, ],
-                [ 9, 3, 8, 1, 4, 6, 5, 7, 2, ],
-                [ 5, 9, 1, 4, 2, 7, 8, 3, 6, ],
-                [ 6, 8, 7, 3, 1, 5, 4, 2, 9, ],
-                [ 2, 4, 3, 9, 6, 8, 1, 5, 7, ],
-                [ 3, 5, 9, 2, 8, 4, 7, 6, 1, ],
-                [ 8, 1, 6, 7, 9, 3, 2, 4, 5, ],
-                [ 7, 2, 4, 6, 5, 1, 9, 8, 3, ],
-            ],
+        for backend in ["CP_SAT", "SCIP"]:
+            with self.subTest(backend=backend):
+                self._assert_solved_instance(
+                    "example_killer_sudoku.txt",
+                    [
+                        [ 1, 6, 5, 8, 7, 2, 3, 9, 4, ],
+                        [ 4, 7, 2, 5, 3, 9, 6, 1, 8, ],
+                        [ 9, 3, 8, 1, 4, 6, 5, 7, 2, ],
+                        [ 5, 9, 1, 4, 2, 7, 8, 3, 6, ],
+                        [ 6, 8, 7, 3, 1, 5, 4, 2, 9, ],
+                        [ 2, 4, 3, 9, 6, 8, 1, 5, 7, ],
+                        [ 3, 5, 9, 2, 8, 4, 7, 6, 1, ],
+                        [ 8, 1, 6, 7, 9, 3, 2, 4, 5, ],
+                        [ 7, 2, 4, 6, 5, 1, 9, 8, 3, ],
+                    ],
+                    backend=backend,
+                )
+
+    def test_solve_killer_sudoku_conflicting_givens(self) -> None:
+        with open(runfiles.Create().Rlocation("sudoku_solver/example_killer_sudoku.txt")) as f:
+            problem = sudoku_solver.Problem.parse(f)
+        problem.problem[frozenset([(1, 1)])] = 2
+        for backend in ["CP_SAT", "SCIP"]:
+            with self.subTest(backend=backend):
+                with self.assertRaises(ValueError):
+                    problem.solve(backend=backend)
+
+    def test_solve_killer_sudoku_conflicting_givens_scip(self) -> None:
+        # Propagation eliminates the value of a preassigned cell.
+        problem = sudoku_solver.Problem({
+            frozenset([(1, 1)]): 5,
+            frozenset([(1, 9)]): 5,
+            frozenset([(2, 1), (2, 2)]): 3,
+        })
+        with self.assertRaisesRegex(ValueError, "no solution"):
+            problem.solve(backend="SCIP")
+
+    def test_solve_killer_sudoku_unreachable_sum_scip(self) -> None:
+        with open(runfiles.Create().Rlocation("sudoku_solver/example_killer_sudoku.txt")) as f:
+            problem = sudoku_solver.Problem.parse(f)
+        problem.problem[frozenset([(1, 1), (1, 2)])] = 16
+        with self.assertRaises(ValueError):
+            problem.solve(backend="SCIP")
+
+    def test_propagate(self) -> None:
+        candidates = sudoku_solver.Problem({
+            frozenset([(1, 1), (1, 2)]): 3,
+            frozenset([(4, 1)]): 1,
+        })._propagate()
+        self.assertEqual(candidates[(0, 0)], {2})
+        self.assertEqual(candidates[(0, 1)], {1})
+        self.assertEqual(candidates[(3, 0)], {1})
+        self.assertEqual(candidates[(8, 0)], set(range(3, 10)))
+
+    def test_parse(self) -> None:
+        problem = sudoku_solver.Problem.parse(io.StringIO(
+            "# a comment\n"
+            "\n"
+            "(1,2), (1,1) ,(2,1):11  # trailing comment\n"
+            "(9,9):4\n"
+        ))
+        self.assertEqual(
+            problem.problem,
+            {frozenset([(1, 1), (1, 2), (2, 1)]): 11, frozenset([(9, 9)]): 4},
         )
+        self.assertEqual(str(problem), "(1,1),(1,2),(2,1):11\n(9,9):4")
 
-    def _assert_solved_instance(self, input: str, expected: list[list[int]]) -> None:
-        with open(runfiles.Create().Rlocation(f"sudoku_solver/{input}"), "r") as f:
+    def test_solution_str(self) -> None:
+        with open(runfiles.Create().Rlocation("sudoku_solver/example_sudoku.txt")) as f:
+            solution = sudoku_solver.Problem.parse(f).solve()
+        self.assertEqual(
+            str(solution),
+            "+-------+-------+-------+\n"
+            "| 6 4 2 | 7 9 1 | 3 8 5 |\n"
+            "| 1 3 7 | 5 8 6 | 2 4 9 |\n"
+            "| 8 9 5 | 4 3 2 | 1 7 6 |\n"
+            "+-------+-------+-------+\n"
+            "| 4 6 1 | 8 7 5 | 9 3 2 |\n"
+            "| 3 5 8 | 2 6 9 | 4 1 7 |\n"
+            "| 7 2 9 | 1 4 3 | 6 5 8 |\n"
+            "+-------+-------+-------+\n"
+            "| 9 1 3 | 6 5 7 | 8 2 4 |\n"
+            "| 5 8 6 | 3 2 4 | 7 9 1 |\n"
+            "| 2 7 4 | 9 1 8 | 5 6 3 |\n"
+            "+-------+-------+-------+",
+        )
+
+    def test_solve_cached(self) -> None:
+        with open(runfiles.Create().Rlocation("sudoku_solver/example_killer_sudoku.txt")) as f:
             problem = sudoku_solver.Problem.parse(f)
         solution = problem.solve()
+        self.assertIs(sudoku_solver.Problem(dict(problem.problem)).solve(), solution)
+        self.assertIsNot(problem.solve(backend="SCIP"), solution)
+
+        problem.problem[frozenset([(1, 1), (1, 2)])] = 16
+        cache_size = sudoku_solver._solve_cached.cache_info().currsize
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                problem.solve(backend="SCIP")
+        self.assertEqual(sudoku_solver._solve_cached.cache_info().currsize, cache_size)
+
+    def test_parse_empty_group(self) -> None:
+        with self.assertRaises(ValueError):
+            sudoku_solver.Problem.parse(io.StringIO("x:5\n"))
+
+    def test_solve_empty_group(self) -> None:
+        for backend in ["CP_SAT", "SCIP", "DLX"]:
+            with self.subTest(backend=backend):
+                with self.assertRaises(ValueError):
+                    sudoku_solver.Problem({frozenset(): 0}).solve(backend=backend)
+
+    def test_solution_getitem_out_of_range(self) -> None:
+        solution = sudoku_solver.Solution(bytes(range(81)))
+        self.assertEqual(solution[(9, 5)], 76)
+        for cell in [(0, 5), (1, 10), (10, 1), (1, 0)]:
+            with self.subTest(cell=cell):
+                with self.assertRaises(KeyError):
+                    solution[cell]
+
+    def test_solve_sudoku_conflicting_givens(self) -> None:
+        problem = sudoku_solver.Problem({
+            frozenset([(1, 1)]): 5,
+            frozenset([(1, 9)]): 5,
+        })
+        with self.assertRaises(ValueError):
+            problem.solve()
+
+    def _assert_solved_instance(
+        self,
+        input: str,
+        expected: list[list[int]],
+        **kwargs: typing.Any,
+    ) -> None:
+        with open(runfiles.Create().Rlocation(f"sudoku_solver/{input}"), "r") as f:
+            problem = sudoku_solver.Problem.parse(f)
+        solution = problem.solve(**kwargs)
         for row, col in itertools.product(*(2 * [range(1, 10)])):
             self.assertEqual(solution[(row, col)], expected[row - 1][col - 1])
 